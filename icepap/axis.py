@@ -12,15 +12,25 @@
 # -----------------------------------------------------------------------------
 
 import weakref
-import struct
 import collections
+
+import numpy
+
 from .vdatalib import vdata, ADDRUNSET, POSITION, PARAMETER, SLOPE, DWORD, \
     FLOAT
-from .utils import State
+from .utils import State, as_int_array
 from .fwversion import FirmwareVersion
 
 __all__ = ['IcePAPAxis']
 
+# Binary table data types, as numpy dtypes
+_USHORT_DTYPES = {
+    'DWORD': numpy.int32,
+    'FLOAT': numpy.float32,
+    'DFLOAT': numpy.float64,
+    'BYTE': numpy.int8,
+}
+
 
 class IcePAPAxis:
     """
@@ -32,6 +42,8 @@ class IcePAPAxis:
         ref = weakref.ref(ctrl)
         self._ctrl = ref()
         self._axis_nr = axis_nr
+        # Address prefix of every command sent to this axis
+        self._cmd_prefix = '{0}:'.format(axis_nr)
 
         # if self._axis_nr != self.addr:
         #     msg = 'Initialization error: axis_nr {0} != adr {1}'.format(
@@ -46,59 +58,56 @@ class IcePAPAxis:
 
     @staticmethod
     def get_ushort_list(ldata, dtype='FLOAT'):
-        dtype = dtype.upper()
-        if dtype == 'DWORD':
-            pack_format = '{0}i'
-            factor = 2
-        elif dtype == 'FLOAT':
-            pack_format = '{0}f'
-            factor = 2
-        elif dtype == 'DFLOAT':
-            pack_format = '{0}d'
-            factor = 4
-        elif dtype == 'BYTE':
-            pack_format = '{0}b'
-            factor = 0.5
-        else:
-            raise ValueError('dtype is not valid')
-
-        data_len = len(ldata)
-        data_pck = struct.pack(pack_format.format(data_len), *ldata)
+        """
+        Reinterpret the data as unsigned shorts, as sent in binary blocks.
 
-        unpack_format = '{0}H'.format(int(data_len * factor))
-        lushorts = struct.unpack(unpack_format, data_pck)
-        return lushorts
+        :param ldata: [number] or numpy array
+        :param dtype: str { DWORD | FLOAT | DFLOAT | BYTE }
+        :return: numpy.ndarray (uint16)
+        """
+        try:
+            np_dtype = _USHORT_DTYPES[dtype.upper()]
+        except KeyError:
+            raise ValueError('dtype is not valid')
+        # One C level conversion and a view, without packing the values
+        # one by one. Integer types must not silently truncate floats.
+        if numpy.issubdtype(np_dtype, numpy.integer):
+            data = as_int_array(ldata, np_dtype)
+        else:
+            data = numpy.ascontiguousarray(ldata, dtype=np_dtype)
+        return data.view(numpy.uint16)
 
     @staticmethod
     def get_dump_values(raw_table, dtype='FLOAT'):
         # TODO: use the memory map.
-        values = []
+        raw_values = []
         for raw_value in raw_table:
-            try:
-                id_value, _, value = raw_value.strip().split(':')
-            except Exception:
+            if raw_value.count(':') != 2:
                 raise RuntimeError('There are not values loaded on the '
                                    'ecam table.')
-            values.append(float(value))
-            last_id_data, len_data = id_value.split('/')
+            raw_values.append(raw_value.rpartition(':')[2])
+        # Convert all the values at once, only the last line is needed
+        # for the indexes
+        values = numpy.array(raw_values, dtype=numpy.float64).tolist()
+        id_value = raw_table[-1].strip().partition(':')[0]
+        last_id_data, len_data = id_value.split('/')
         last_id_data = int(last_id_data)
         len_data = int(len_data)
         return values, last_id_data, len_data
 
     def _get_dump_table(self, cmd, dtype='FLOAT'):
         MAX_SUBSET_SIZE = 200
+        # The data dumped from list position table has a bug the total
+        # len is not correct
+        len_offset = 1 if 'LISTDAT' in cmd.upper() else 0
         table = []
         start_pos = 0
         while True:
             raw_table = self.send_cmd(cmd.format(MAX_SUBSET_SIZE, start_pos))
             values, last_id, len_data = self.get_dump_values(raw_table,
                                                              dtype)
-            table += values
-            # The data dumped from list position table has a bug the total
-            # len is not correct
-            if 'LISTDAT' in cmd.upper():
-                len_data -= 1
-            if int(last_id) == int(len_data):
+            table.extend(values)
+            if last_id == len_data - len_offset:
                 break
             start_pos = last_id + 1
         return table
@@ -158,7 +167,7 @@ class IcePAPAxis:
 
         :return: State
         """
-        return State(self.status)
+        return State.from_register(self.status)
 
     @property
     def state_present(self):
@@ -1223,7 +1232,7 @@ class IcePAPAxis:
         # NOTE: SOMETIMES PARVEL 10 RETURNS EXCEPTION:
         # xx:PARVEL ERROR Out of range parameter(s)
         # AND IS AVOIDED BY SETTING IT FIRST TO 0 !!!
-        values = [0, value]
+        values = [0, value] if value != 0 else [0]
         for v in values:
             cmd = 'PARVEL {0}'.format(v)
             self.send_cmd(cmd)
@@ -1449,8 +1458,7 @@ class IcePAPAxis:
         :param cmd: Command without axis number
         :return: [str]
         """
-        cmd = '{0}:{1}'.format(self._axis_nr, cmd)
-        return self._ctrl.send_cmd(cmd)
+        return self._ctrl.send_cmd(self._cmd_prefix + cmd)
 
     def get_cfginfo(self, parameter=''):
         """
@@ -1815,16 +1823,17 @@ class IcePAPAxis:
         :param source: str
         :param dtype: str
         """
-        # Sort the given list of points in ascending order
-        # (<list>.sort() slightly more efficient:
-        lpos.sort()
-        lushorts = self.get_ushort_list(lpos, dtype)
+        # The points must be in ascending order. Sort a copy only when
+        # needed, the caller data is not modified
+        positions = numpy.asarray(lpos)
+        if positions.size > 1 and (positions[1:] < positions[:-1]).any():
+            positions = numpy.sort(positions)
+        lushorts = self.get_ushort_list(positions, dtype)
         if len(lushorts) > 40954:
             raise ValueError('There is not enough memory to load the list.')
 
         cmd = '*ECAMDAT {0} {1}'.format(source, dtype)
-        self.send_cmd(cmd)
-        self._ctrl._comm.send_binary(lushorts)
+        self._ctrl._comm.send_binary_cmd(self._cmd_prefix + cmd, lushorts)
 
     def clear_ecam_table(self):
         """
@@ -1856,8 +1865,7 @@ class IcePAPAxis:
         #     raise ValueError('There is not enough memory to load the list.')
 
         cmd = '*LISTDAT {0} {1}'.format(['NOCYCLIC', 'CYCLIC'][cyclic], dtype)
-        self.send_cmd(cmd)
-        self._ctrl._comm.send_binary(lushorts)
+        self._ctrl._comm.send_binary_cmd(self._cmd_prefix + cmd, lushorts)
 
     def clear_list_table(self):
         """
@@ -1896,11 +1904,11 @@ class IcePAPAxis:
         if lslope is not None:
             data.append(lslope, self.addr, SLOPE, format=slope_type)
 
-        bin_data = data.bin().flatten()
-        lushorts = self.get_ushort_list(bin_data, dtype='BYTE')
+        # The binary block is already contiguous and padded to dwords, view
+        # it as unsigned shorts without copying
+        lushorts = data.bin().view(numpy.uint16)
         cmd = '*PARDAT {0}'.format(mode)
-        self.send_cmd(cmd)
-        self._ctrl._comm.send_binary(lushorts)
+        self._ctrl._comm.send_binary_cmd(self._cmd_prefix + cmd, lushorts)
 
     def clear_parametric_table(self):
         """
@@ -125,10 +125,10 @@ def cli(ctx, icepap, axes_str, table_style, pb_format, title, bottom_toolbar):
     ctx.obj["icepap"] = icepap
     ctx.obj["axes_str"] = axes_str
     ctx.obj['axes'] = get_axes(icepap, axes_str)
-    alive_axes = get_axes(icepap, 'alive')
-    all_axes = get_axes(icepap, 'all')
-    not_alive_axes = list(set(all_axes) - set(alive_axes))
     if axes_str == 'all':
+        # Only scan the racks again for the alive axes when they are shown
+        alive_axes = get_axes(icepap, 'alive')
+        not_alive_axes = list(set(ctx.obj['axes']) - set(alive_axes))
         click.echo('Warning: There are not alive axes: {}'.format(
             ', '.join(not_alive_axes)))
     ctx.obj['table_style'] = table_style
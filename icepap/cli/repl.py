@@ -37,13 +37,22 @@ class Toolbar:
             self.addr = "{}:{}".format(self.icepap.host, self.icepap.port)
         else:
             self.addr = self.icepap.host
+        self._msg = None
+
+    def refresh(self):
+        """Read the firmware version again on the next redraw"""
+        self._msg = None
 
     def __call__(self):
-        msg = "icepapctl {} | {} - {}| " \
-              "<b>[F5]</b>: State <b>[F6]</b>: Status | " \
-              "<b>[Ctrl-D]</b>: Quit".format(sw_version, self.addr,
-                                             self.icepap.fver)
-        return HTML(msg)
+        # The toolbar is redrawn on every key press: only ask the icepap
+        # for its version once per prompt
+        if self._msg is None:
+            msg = "icepapctl {} | {} - {}| " \
+                  "<b>[F5]</b>: State <b>[F6]</b>: Status | " \
+                  "<b>[Ctrl-D]</b>: Quit".format(sw_version, self.addr,
+                                                 self.icepap.fver)
+            self._msg = HTML(msg)
+        return self._msg
 
 
 class Completer(BaseCompleter):
@@ -256,6 +265,8 @@ def run(context):
     while True:
         try:
             step(prompt, context)
+            # The command may have changed the firmware (e.g. PROG)
+            prompt.bottom_toolbar.refresh()
         except EOFError:
             # Ctrl-D
             break
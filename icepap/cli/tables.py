@@ -9,6 +9,9 @@ ERROR_COLOR = "bright_red"
 OK_COLOR = "green"
 WARNING_COLOR = "bright_yellow"
 
+# Registers shown by the position and encoder tables
+REGISTERS = ("AXIS", "MEASURE", "ENCIN", "INPOS", "ABSENC", "MOTOR")
+
 
 def bool_text(data, false="NO", true="YES"):
     return true if data else false
@@ -110,29 +113,31 @@ def StatusTable(group, style=beautifultable.Style.STYLE_BOX_ROUNDED):
     stop_codes = set()
     disable_codes = set()
     for motor, name, state in zip(*args):
-        if state.get_stop_code() != 0:
-            stop_codes.add(state.get_stop_code())
-        if state.get_disable_code() != 0:
-            disable_codes.add(state.get_disable_code())
+        stop_code = state.get_stop_code()
+        disable_code = state.get_disable_code()
+        if stop_code != 0:
+            stop_codes.add(stop_code)
+        if disable_code != 0:
+            disable_codes.add(disable_code)
         row = (motor.axis, name,
                bool_text_color(state.is_alive()),
                mode_text_color(motor),
                bool_text_color(state.is_ready()),
                bool_text_color(state.is_poweron(), "OFF", "ON"),
-               disable_text_color(state.get_disable_code()),
-               stop_code_text_color(state.get_stop_code()),
+               disable_text_color(disable_code),
+               stop_code_text_color(stop_code),
                limits_text_color(state))
         table.rows.append(row)
-    output = '{}\n\n'.format(table)
+    lines = ['{}\n'.format(table)]
     if disable_codes is not None:
-        output += 'Disable codes:\n'
+        lines.append('Disable codes:')
         for disable_code in disable_codes:
-            output += '  {}\n'.format(disable_text_color(disable_code, True))
+            lines.append('  {}'.format(disable_text_color(disable_code, True)))
     if stop_codes is not None:
-        output += 'Stop codes:\n'
+        lines.append('Stop codes:')
         for stop_code in stop_codes:
-            output += '  {}\n'.format(stop_code_text_color(stop_code, True))
-    return output
+            lines.append('  {}'.format(stop_code_text_color(stop_code, True)))
+    return '\n'.join(lines) + '\n'
 
 
 def StateTable(group, style=beautifultable.Style.STYLE_BOX_ROUNDED):
@@ -150,14 +155,8 @@ def StateTable(group, style=beautifultable.Style.STYLE_BOX_ROUNDED):
 def PositionTable(group, style=beautifultable.Style.STYLE_BOX_ROUNDED):
     ctrl, axes = group.controller, group.axes
     table = Table(style=style)
-    header = "Axis", "AXIS", "MEASURE", "ENCIN", "INPOS", "ABSENC", "MOTOR"
-    table.columns.header = header
-
-
-    cols = [
-        ctrl.get_pos(axes, register=register)
-        for i, register in enumerate(header[1:])
-    ]
+    table.columns.header = ("Axis",) + REGISTERS
+    cols = [ctrl.get_pos(axes, register=register) for register in REGISTERS]
     for row in zip(axes, *cols):
         table.rows.append(row)
     return table
@@ -166,12 +165,8 @@ def PositionTable(group, style=beautifultable.Style.STYLE_BOX_ROUNDED):
 def EncoderTable(group, style=beautifultable.Style.STYLE_BOX_ROUNDED):
     ctrl, axes = group.controller, group.axes
     table = Table(style=style)
-    header = "Axis", "AXIS", "MEASURE", "ENCIN", "INPOS", "ABSENC", "MOTOR"
-    table.columns.header = header
-    cols = [
-        ctrl.get_enc(axes, register=register)
-        for i, register in enumerate(header[1:])
-    ]
+    table.columns.header = ("Axis",) + REGISTERS
+    cols = [ctrl.get_enc(axes, register=register) for register in REGISTERS]
     for row in zip(axes, *cols):
         table.rows.append(row)
     return table
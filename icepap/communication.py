@@ -11,15 +11,20 @@
 # along with icepap. If not, see <http://www.gnu.org/licenses/>.
 # -----------------------------------------------------------------------------
 
-import array
 import struct
 import threading
 
+import numpy
+
 from .tcp import TCP, Timeout
+from .utils import as_int_array
 
 
 __all__ = ['IcePAPCommunication']
 
+# Binary block header: start mark, number of words and checksum
+_BINARY_HEADER = struct.Struct('<III')
+
 
 class IcePAPCommunication:
     """
@@ -31,7 +36,9 @@ class IcePAPCommunication:
     def __init__(self, host, port=5000, timeout=3):
         self._sock = TCP(host, port, timeout=timeout)
         self._sock.connect()
-        self._lock = threading.Lock()
+        # Reentrant: send_binary_cmd holds it across a command and its
+        # binary block
+        self._lock = threading.RLock()
         self.multiline_answer = False
 
     @property
@@ -55,7 +62,6 @@ class IcePAPCommunication:
         :return: None or list of string without the command and the CRLF.
         """
         self.multiline_answer = False
-        cmd.upper().strip()
         flg_read_cmd = '?' in cmd
         flg_ecamdat_cmd = '*ECAMDAT' in cmd
         flg_listdat_cmd = '*LISTDAT' in cmd
@@ -73,10 +79,9 @@ class IcePAPCommunication:
             cmd = '#{0}\r'.format(cmd)
             use_ack = True
 
-        if '?' in cmd or '#' in cmd:
-            wait_ans = True
-        else:
-            wait_ans = False
+        # Queries and acknowledged commands answer. Reuse the flags
+        # instead of scanning the formatted command again
+        wait_ans = flg_read_cmd or use_ack or '#' in cmd
 
         with self._lock:
             # The write command is inside the lock on purpose. The issue is, if
@@ -111,12 +116,12 @@ class IcePAPCommunication:
             elif '$' in ans:
                 self.multiline_answer = True
                 # Multi lines
-                ans = ans.split('$')[1]
+                ans = ans.partition('$')[2].partition('$')[0]
                 lines = ans.split('\n')[1:-1]
                 # remove CR
-                result = [line.split('\r')[0] for line in lines]
+                result = [line.partition('\r')[0] for line in lines]
             else:
-                ans = ans.split('\r\n')[0]
+                ans = ans.partition('\r\n')[0]
                 result = ans.split()[1:]
                 if len(result) == 0:
                     result = None
@@ -129,23 +134,46 @@ class IcePAPCommunication:
         """
         Method to send a binary data to the IcePAP controller.
 
-        :param ushort_data: Data converted to a unsigned short list.
+        :param ushort_data: Data converted to unsigned shorts: a list or any
+                            buffer of unsigned shorts (numpy array, array,
+                            memoryview).
+        """
+        str_bin = self._binary_block(ushort_data)
+        # Like commands, the block is written holding the lock so it can not
+        # interleave with a command sent from another thread. The context
+        # manager releases it if the write raises.
+        with self._lock:
+            self._sock.write(str_bin)
+
+    def send_binary_cmd(self, cmd, ushort_data):
         """
+        Method to send a command announcing a binary data block (*ECAMDAT,
+        *LISTDAT, *PARDAT, *PROG...) followed by the block. No command from
+        another thread can be sent in between.
+
+        :param cmd: Command without acknowledge character and CR and/or LF.
+        :param ushort_data: Data converted to unsigned shorts, see
+                            send_binary.
+        """
+        str_bin = self._binary_block(ushort_data)
+        with self._lock:
+            self.send_cmd(cmd)
+            self._sock.write(str_bin)
+
+    @staticmethod
+    def _binary_block(ushort_data):
         # Prepare Metadata header
         startmark = 0xa5aa555a
-        nworddata = len(ushort_data)
-        checksum = sum(ushort_data)
+        # Buffers are viewed, not copied
+        words = as_int_array(ushort_data, numpy.uint16)
+        nworddata = words.size
+        # Vectorized sum, accumulated on 64 bits so it can not overflow
+        checksum = int(words.sum(dtype=numpy.uint64))
         maskedchksum = checksum & 0xffffffff
-        data = array.array('H', ushort_data)
-
-        str_startmark = struct.pack('L', startmark)[:4]
-        str_nworddata = struct.pack('L', nworddata)[:4]
-        str_maskedchksum = struct.pack('L', maskedchksum)[:4]
-        str_data = data.tobytes()
-        str_bin = str_startmark + str_nworddata + str_maskedchksum + str_data
-        str_bin += b'\r'
 
-        self._sock.write(str_bin)
+        header = _BINARY_HEADER.pack(startmark, nworddata, maskedchksum)
+        # Join header, data and terminator with a single copy of the data
+        return b''.join((header, words, b'\r'))
 
     def disconnect(self):
         """
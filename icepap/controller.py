@@ -36,7 +36,6 @@ __all__ = ['IcePAPController']
 
 import time
 import logging
-import array
 import urllib.parse
 import collections.abc
 from .communication import IcePAPCommunication
@@ -45,11 +44,25 @@ from .utils import State
 from .fwversion import SUPPORTED_VERSIONS, FirmwareVersion
 
 
+def _set_bits(mask):
+    """
+    Yield the positions of the bits set in mask, from the lowest one. Only
+    the set bits are visited.
+
+    :param mask: int
+    """
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
+
+
 class IcePAPController:
     """
     IcePAP motor controller class.
     """
-    ALL_AXES_VALID = set([r * 10 + i for r in range(16) for i in range(1, 9)])
+    ALL_AXES_VALID = frozenset(r * 10 + i
+                               for r in range(16) for i in range(1, 9))
 
     def __init__(self, host, port=5000, timeout=3, auto_axes=False, **kwargs):
         log_name = '{0}.IcePAPController'.format(__name__)
@@ -80,10 +93,8 @@ class IcePAPController:
 
     def __delitem__(self, key):
         self._axes.pop(key)
-        aliases_to_remove = []
-        for alias, axis in self._aliases.items():
-            if key == axis:
-                aliases_to_remove.append(alias)
+        aliases_to_remove = [alias for alias, axis in self._aliases.items()
+                             if key == axis]
         for alias in aliases_to_remove:
             self._aliases.pop(alias)
 
@@ -97,11 +108,11 @@ class IcePAPController:
         return msg
 
     def _get_axis_for_alias(self, alias):
-        if alias not in self._aliases:
+        axis = self._aliases.get(alias)
+        if axis is None:
             msg = 'There is not any motor with name {0}'.format(alias)
             raise ValueError(msg)
-        alias = self._aliases[alias]
-        return alias
+        return axis
 
     def _alias2axisstr(self, alias):
         """
@@ -120,10 +131,7 @@ class IcePAPController:
         elif isinstance(alias, IcePAPAxis):
             result = str(alias.axis)
         elif isinstance(alias, list):
-            result = []
-            for i in alias:
-                result.append(self._alias2axisstr(i))
-            result = ' '.join(result)
+            result = ' '.join(map(self._alias2axisstr, alias))
         else:
             raise ValueError()
         return result
@@ -136,11 +144,9 @@ class IcePAPController:
 
         :return: str
         """
-        result = ''
-        for axis, value in axes_values:
-            result += '{0} {1} '.format(self._alias2axisstr(axis),
-                                        cast_type(value))
-        return result
+        return ' '.join('{0} {1}'.format(self._alias2axisstr(axis),
+                                         cast_type(value))
+                        for axis, value in axes_values)
 
     @classmethod
     def from_url(cls, url):
@@ -256,35 +262,24 @@ class IcePAPController:
         # Take the list of racks present in the system
         # IcePAP user manual pag. 137
         racks_present = int(self._comm.send_cmd('?sysstat')[0], 16)
-        rack_mask = 1
         axes = []
-        for i in range(16):
-            if (racks_present & rack_mask << i) > 0:
-                # Take the motors presents for a rack.
-                cmd = '?sysstat {0}'.format(i)
-                drivers_mask = self._comm.send_cmd(cmd)
-                # TODO: Analyze if use the present or the alive mask
-                if only_alive:
-                    # Drivers alive
-                    drvs = int(drivers_mask[1], 16)
-                else:
-                    # Drivers present
-                    drvs = int(drivers_mask[0], 16)
-                drv_mask = 1
-                for j in range(8):
-                    if (drvs & drv_mask << j) > 0:
-                        axis_nr = i * 10 + j + 1
-                        axes.append(axis_nr)
+        for i in _set_bits(racks_present & 0xffff):
+            # Take the motors presents for a rack.
+            cmd = '?sysstat {0}'.format(i)
+            drivers_mask = self._comm.send_cmd(cmd)
+            # TODO: Analyze if use the present or the alive mask
+            if only_alive:
+                # Drivers alive
+                drvs = int(drivers_mask[1], 16)
+            else:
+                # Drivers present
+                drvs = int(drivers_mask[0], 16)
+            axes.extend(i * 10 + j + 1 for j in _set_bits(drvs & 0xff))
         return axes
 
     def find_racks(self):
         racks_present = int(self._comm.send_cmd('?sysstat')[0], 16)
-        racks_mask = 1
-        racks = []
-        for i in range(16):
-            if (racks_present & racks_mask << i) > 0:
-                racks.append(i)
-        return racks
+        return list(_set_bits(racks_present & 0xffff))
 
     def update_axes(self):
         """
@@ -295,12 +290,9 @@ class IcePAPController:
 
         :return:
         """
-        alive_axes = self.find_axes()
-        axes_to_remove = []
-
-        for axis in self._axes:
-            if axis not in alive_axes:
-                axes_to_remove.append(axis)
+        alive_axes = set(self.find_axes())
+        axes_to_remove = [axis for axis in self._axes
+                          if axis not in alive_axes]
 
         for axis in axes_to_remove:
             self.__delitem__(axis)
@@ -333,10 +325,7 @@ class IcePAPController:
         """
         aliases = {}
         for key, value in self._aliases.items():
-            if value in aliases:
-                aliases[value].append(key)
-            else:
-                aliases[value] = [key]
+            aliases.setdefault(value, []).append(key)
         return aliases
 
 # -----------------------------------------------------------------------------
@@ -460,7 +449,7 @@ class IcePAPController:
         :return: [State]
         """
         fstatus = self.get_fstatus(axes)
-        return [State(i) for i in fstatus]
+        return list(map(State.from_register, fstatus))
 
     def get_status(self, axes):
         """
@@ -481,16 +470,17 @@ class IcePAPController:
 
         :return: system version number, -1 if not consistent.
         """
-        sys_ver = str(self.ver['SYSTEM']['VER'][0])
-        if sys_ver in list(SUPPORTED_VERSIONS.keys()):
-            if self.ver.is_supported():
-                return self.ver['SYSTEM']['VER'][0]
+        # Each access to the ver property queries the IcePAP
+        ver = self.ver
+        sys_ver = ver['SYSTEM']['VER'][0]
+        if str(sys_ver) in SUPPORTED_VERSIONS:
+            if ver.is_supported():
+                return sys_ver
             else:
                 print('Modules versions are not consistent.')
                 return -1
         else:
-            raise RuntimeError('Version %s not supported' %
-                               self.ver['SYSTEM']['VER'][0])
+            raise RuntimeError('Version %s not supported' % sys_ver)
 
     def reboot(self):
         """
@@ -517,7 +507,7 @@ class IcePAPController:
         """
         if isinstance(rack_nrs, int):
             rack_nrs = [rack_nrs]
-        racks_str = ' '.join(['{}'.format(i) for i in rack_nrs])
+        racks_str = ' '.join(map(str, rack_nrs))
         cmd = '?RID {0}'.format(racks_str)
         return self.send_cmd(cmd)
 
@@ -530,7 +520,7 @@ class IcePAPController:
         """
         if isinstance(rack_nrs, int):
             rack_nrs = [rack_nrs]
-        racks_str = ' '.join(['{}'.format(i) for i in rack_nrs])
+        racks_str = ' '.join(map(str, rack_nrs))
         cmd = '?RTEMP {0}'.format(racks_str)
         return list(map(float, self.send_cmd(cmd)))
 
@@ -753,12 +743,12 @@ class IcePAPController:
             save_str = 'SAVE'
         cmd = '*PROG {} {} {} {}'.format(comp_str, force_str, save_str,
                                          options)
-        self.send_cmd(cmd)
 
         with open(filename, 'rb') as f:
             data = f.read()
-        data = array.array('H', data)
-        self._comm.send_binary(ushort_data=data)
+        # View the image as unsigned shorts instead of copying it
+        data = memoryview(data).cast('H')
+        self._comm.send_binary_cmd(cmd, data)
 
     def prog(self, component, force=False):
         """
@@ -85,8 +85,12 @@ class FirmwareVersion(dict):
         super(FirmwareVersion, self).__init__()
         self.is_axis = is_axis
         for line in data:
-            v = line.split(':', 2)
-            length = len(line.split(line.lstrip())[0])
+            stripped = line.lstrip()
+            if not stripped:
+                continue
+            v = stripped.split(':', 2)
+            # Indentation gives the component level
+            length = len(line) - len(stripped)
             # print 'length = %s' % l
             component = v[0].strip()
             try:
@@ -63,7 +63,8 @@ class Group:
         return get_ctrl_item(self.controller.get_fpos, self.axes)
 
     def get_states(self):
-        return get_ctrl_item(self.controller.get_states, self.axes, State(0))
+        return get_ctrl_item(self.controller.get_states, self.axes,
+                             State.from_register(0))
 
     def is_moving(self):
         return is_moving(self.get_states())
@@ -26,6 +26,15 @@ OPENING, OPEN, CLOSED = range(3)
 
 BLOCK_SIZE = 8192
 
+# TCP keep-alive tuning: probe an idle connection after 30s, every 5s, and
+# drop it after 3 unanswered probes. Options missing or rejected on a
+# platform are skipped.
+KEEPALIVE_OPTIONS = (
+    ("TCP_KEEPIDLE", 30),
+    ("TCP_KEEPINTVL", 5),
+    ("TCP_KEEPCNT", 3),
+)
+
 
 ERR_MAP = {
     errno.ECONNREFUSED: ConnectionRefusedError,
@@ -45,6 +54,17 @@ def create_connection(host, port):
     sock = socket.socket()
     sock.setblocking(False)
     sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in KEEPALIVE_OPTIONS:
+        option = getattr(socket, name, None)
+        if option is None:
+            continue
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+        except OSError:
+            # Some platforms define the option but reject it. The tuning is
+            # best effort, keep-alive stays on with the system defaults.
+            pass
     res = sock.connect_ex((host, port))
     allowed_results = [0, errno.EINPROGRESS]
     # Non-blocking sockets on Windows give the WSAEWOULDBLOCK when opening.
@@ -140,6 +160,9 @@ class RawTCP:
 
     @close_on_error
     def _write(self, data):
+        if len(data) > BLOCK_SIZE:
+            # Slicing a memoryview does not copy the blocks
+            data = memoryview(data).cast('B')
         for start in range(0, len(data), BLOCK_SIZE):
             _, w, _ = select.select((), (self._sock,), (), self.timeout)
             if not w:
@@ -169,13 +192,20 @@ class RawTCP:
         if eo:
             self._buffer = left
             return data + eo
+        # Grow a bytearray in place and only search the data just received
+        # (and the tail an eol could start in): long answers arrive in many
+        # blocks
+        buff = bytearray(self._buffer)
         for data in stream(self._sock, timeout=timeout):
-            self._buffer += data
-            data, eo, left = self._buffer.partition(eol)
-            if eo:
-                self._buffer = left
-                return data + eo
+            start = max(len(buff) - len(eol) + 1, 0)
+            buff += data
+            index = buff.find(eol, start)
+            if index >= 0:
+                end = index + len(eol)
+                self._buffer = bytes(buff[end:])
+                return bytes(buff[:end])
         else:
+            self._buffer = bytes(buff)
             raise ConnectionError("remote end closed")
 
     def state(self):
@@ -12,13 +12,39 @@
 # -----------------------------------------------------------------------------
 
 __all__ = ['Info', 'Registers', 'State', 'TrackMode', 'Answers', 'Mode',
-           'EdgeType', 'deprecated']
+           'EdgeType', 'InfoSource', 'RegisterId', 'deprecated',
+           'is_moving_batch', 'as_int_array']
 
 # TODO: Check the Mode, Answers, TrackMode, Info and Register classes.
 
+import collections
+import enum
+import functools
+import inspect
+import operator
 import os
 import signal
+import struct
+import sys
 import time
+import warnings
+
+import numpy
+
+
+_warnings_patched = False
+
+
+def _patch_warnings():
+    # Force warnings.warn() to omit the source code line in the message.
+    # Done once, wrapping the formatter again on each call would nest it.
+    global _warnings_patched
+    if _warnings_patched:
+        return
+    formatwarning_orig = warnings.formatwarning
+    warnings.formatwarning = lambda msg, cat, fname, lineno, line=None: \
+        formatwarning_orig(msg, cat, fname, lineno, line='')
+    _warnings_patched = True
 
 
 def deprecated(alt=None):
@@ -28,27 +54,26 @@ def deprecated(alt=None):
     @return: decorated function with a deprecation message.
     """
     def _deprecated(f):
-        from inspect import isclass, isfunction
-        import warnings
-        warnings.simplefilter("once")
-        # Force warnings.warn() to omit the source code line in the message
-        formatwarning_orig = warnings.formatwarning
-        warnings.formatwarning = lambda msg, cat, fname, lineno, line=None: \
-            formatwarning_orig(msg, cat, fname, lineno, line='')
+        _patch_warnings()
+        if inspect.isfunction(f):
+            obj_type = 'method'
+        elif inspect.isclass(f):
+            obj_type = 'class'
+        else:
+            msg = "Decorated object is not a class nor a function."
+            raise RuntimeError(msg)
+        msg = "%s <%s> will be deprecated soon. " % (obj_type, f.__name__)
+        msg += "Use new API %s <%s> instead." % (obj_type, alt)
+        warned = False
 
         def new_func(*args, **kwargs):
-            if isfunction(f):
-                obj_type = 'method'
-            elif isclass(f):
-                obj_type = 'class'
-            else:
-                msg = "Decorated object is not a class nor a function."
-                raise RuntimeError(msg)
-            msg = "%s <%s> will be deprecated soon. " % (obj_type, f.__name__)
-            msg += "Use new API %s <%s> instead." % (obj_type, alt)
-            warnings.warn(msg, PendingDeprecationWarning, stacklevel=0)
-            ans = f(*args, **kwargs)
-            return ans
+            nonlocal warned
+            # Warn on the first call only, the later ones skip the warnings
+            # machinery. FutureWarning is shown by the default filters.
+            if not warned:
+                warned = True
+                warnings.warn(msg, FutureWarning, stacklevel=2)
+            return f(*args, **kwargs)
         return new_func
     return _deprecated
 
@@ -57,6 +82,8 @@ class Mode:
     """
     Icepap modes (IcePAP user manual pag. 22).
     """
+    __slots__ = ()
+
     CONFIG, OPER, PROG, TEST, FAIL = 'CONFIG', 'OPER', 'PROG', 'TEST', 'FAIL'
 
 
@@ -64,6 +91,8 @@ class Answers:
     """
     Icepap answers values (str)
     """
+    __slots__ = ()
+
     ON, OFF = "ON", "OFF"
 
 
@@ -71,6 +100,8 @@ class TrackMode:
     """
     Track modes (IcePAP user manual pag. 139).
     """
+    __slots__ = ()
+
     SIMPLE, SMART, FULL = 'SIMPLE', 'SMART', 'FULL'
 
 
@@ -78,6 +109,8 @@ class EdgeType:
     """
     Edge type used on search routines. IcePAP user manual pag. 124
     """
+    __slots__ = ()
+
     POSEDGE, NEGEDGE = 'POSEDGE', 'NEGEDGE'
 
 
@@ -85,6 +118,8 @@ class Info:
     """
     Icepap general namespace values.
     """
+    __slots__ = ()
+
     INFOA, INFOB, INFOC = "INFOA", "INFOB", "INFOC"
     LOW, HIGH, LIMP = "LOW", "HIGH", "LIM+"
     LIMN, HOME, ENCAUX, ECAM = "LIM-", "HOME", "ENCAUX", "ECAM"
@@ -107,6 +142,8 @@ class Registers:
     """
     Icepap register namespace values.
     """
+    __slots__ = ()
+
     INTERNAL, SYNC, INPOS, ENCIN = "INTERNAL", "SYNC", "INPOS", "ENCIN"
     IndexerRegisters = [INTERNAL, SYNC, INPOS, ENCIN]
     AXIS, INDEXER, EXTERR = "AXIS", "INDEXER", "EXTERR"
@@ -122,6 +159,176 @@ class Registers:
                            ENCIN, INPOS, ABSENC, MOTOR]
 
 
+class InfoSource(enum.IntEnum):
+    """
+    Info signal sources as integers, in the same order as Info.Sources. Use
+    from_wire() to convert the IcePAP strings once and compare integers
+    afterwards.
+    """
+    LOW, HIGH, LIMP, LIMN, HOME, ENCAUX, INPAUX, SYNCAUX, ENABLE, ALARM, \
+        READY, MOVING, BOOST, STEADY, ECAM = range(15)
+
+    @property
+    def wire(self):
+        """
+        Name used by the IcePAP protocol.
+
+        :return: str
+        """
+        return Info.Sources[self]
+
+    @classmethod
+    def from_wire(cls, value):
+        """
+        Convert an IcePAP source name (e.g. 'LIM+') to InfoSource.
+
+        :param value: str
+        :return: InfoSource
+        """
+        return _INFO_SOURCE_FROM_WIRE[value.upper()]
+
+
+_INFO_SOURCE_FROM_WIRE = {wire: InfoSource(i)
+                          for i, wire in enumerate(Info.Sources)}
+
+
+class RegisterId(enum.IntEnum):
+    """
+    Icepap registers as integers. The member names are the names used by
+    the IcePAP protocol.
+    """
+    AXIS, INDEXER, EXTERR, SHFTENC, TGTENC, CTRLENC, ENCIN, INPOS, ABSENC, \
+        MOTOR, MEASURE, PARAM, INTERNAL, SYNC = range(14)
+
+    @property
+    def wire(self):
+        """
+        Name used by the IcePAP protocol.
+
+        :return: str
+        """
+        return self.name
+
+    @classmethod
+    def from_wire(cls, value):
+        """
+        Convert an IcePAP register name (e.g. 'ENCIN') to RegisterId.
+
+        :param value: str
+        :return: RegisterId
+        """
+        return cls[value.upper()]
+
+
+@functools.lru_cache(maxsize=128)
+def _u32_struct(n):
+    # struct.Struct to unpack n little endian 32 bits registers
+    return struct.Struct('<%dI' % n)
+
+
+def _unpack_regs(buf, n):
+    return _u32_struct(n).unpack_from(buf)
+
+
+def as_int_array(data, dtype):
+    """
+    Convert data to a contiguous numpy array of the integer dtype, viewing
+    it when possible. Unlike a plain numpy conversion, non integer values
+    and values out of the dtype range raise instead of being truncated.
+
+    :param data: [int] or buffer or numpy array
+    :param dtype: numpy integer dtype
+    :return: numpy.ndarray
+    """
+    values = numpy.asarray(data)
+    if values.dtype == dtype:
+        return numpy.ascontiguousarray(values)
+    if values.size == 0:
+        return numpy.ascontiguousarray(values, dtype=dtype)
+    if values.dtype.kind not in 'iu':
+        raise ValueError('Data must be integers, not {0}'.format(
+            values.dtype))
+    limits = numpy.iinfo(dtype)
+    if values.min() < limits.min or values.max() > limits.max:
+        raise ValueError('Data out of the {0} range'.format(
+            numpy.dtype(dtype)))
+    return numpy.ascontiguousarray(values, dtype=dtype)
+
+
+# Status register fields as (name, shift, mask), in register order.
+_STATE_FIELDS = (
+    ('present', 0, 1),
+    ('alive', 1, 1),
+    ('mode', 2, 3),
+    ('disable', 4, 7),
+    ('indexer', 7, 3),
+    ('ready', 9, 1),
+    ('moving', 10, 1),
+    ('settling', 11, 1),
+    ('outofwin', 12, 1),
+    ('warning', 13, 1),
+    ('stopcode', 14, 15),
+    ('limit_positive', 18, 1),
+    ('limit_negative', 19, 1),
+    ('inhome', 20, 1),
+    ('v5power', 21, 1),
+    ('verserr', 22, 1),
+    ('poweron', 23, 1),
+    ('info', 24, 255))
+
+# Status register masks for the tests done on the raw register. State.unpack
+# keeps its literal masks: they are folded into constants at compile time.
+_DISABLE_MASK = 0x7 << 4
+_MOVING_MASK = 0x1 << 10
+
+# All the fields of a decoded status register, see State.unpack.
+StateFields = collections.namedtuple(
+    'StateFields', [name for name, _, _ in _STATE_FIELDS])
+
+
+# Meaning of the status register codes, indexed by code. The strings are
+# interned so callers can compare the returned values by identity.
+_MODE_STR = tuple(map(sys.intern, (
+    Mode.OPER,
+    Mode.PROG,
+    Mode.TEST,
+    Mode.FAIL)))
+
+_DISABLE_STR = tuple(map(sys.intern, (
+    'Motor power NOT DISABLED',
+    'Motor power is DISABLED because axis is NOT ACTIVE',
+    'Motor power is DISABLED by HARDWARE ALARM',
+    'Motor power is DISABLED due to external RACK DISABLE SIGNAL',
+    'Motor power is DISABLED by the RACK DISABLE SWITCH',
+    'Motor power is DISABLED due to external AXIS DISABLE signal',
+    'Motor power is DISABLED by the AXIS DISABLE SWITCH',
+    'Motor power is DISABLED by SOFTWARE')))
+
+_INDEXER_STR = tuple(map(sys.intern, (
+    'Indexer source is INTERNAL',
+    'Indexer source is INSYSTEM',
+    'Indexer source is EXTERNAL',
+    'Indexer source is LINKED')))
+
+_STOPCODE_STR = tuple(map(sys.intern, (
+    'No abnormal stop condition',
+    'Last motion stopped by a STOP command',
+    'Last motion stopped by an ABORT command or condition',
+    'Last motion stopped when the LIMIT+ was reached',
+    'Last motion stopped when the LIMIT- was reached',
+    'Last motion stopped by a configured stop condition',
+    'Last motion stopped because the axis power was DISABLED',
+    'Last motion stopped ERROR: movement in progress?',
+    'Internal failure',
+    'Motor failure',
+    'Power overload',
+    'Driver overheating',
+    'Close loop error',
+    'Control encoder error',
+    'N/A',
+    'External alarm')))
+
+
 class State:
     """
     Class to evaluate the status register.
@@ -249,61 +456,139 @@ class State:
                             In OPER mode: master indexer
     ========== ============ ===============================================
     """
+    # Kept for backwards compatibility, the accessors use the tuple tables.
     status_meaning = {
-        'mode': {
-            0: Mode.OPER,
-            1: Mode.PROG,
-            2: Mode.TEST,
-            3: Mode.FAIL},
-        'disable': {
-            0: 'Motor power NOT DISABLED',
-            1: 'Motor power is DISABLED because axis is NOT ACTIVE',
-            2: 'Motor power is DISABLED by HARDWARE ALARM',
-            3: 'Motor power is DISABLED due to external RACK DISABLE SIGNAL',
-            4: 'Motor power is DISABLED by the RACK DISABLE SWITCH',
-            5: 'Motor power is DISABLED due to external AXIS DISABLE signal',
-            6: 'Motor power is DISABLED by the AXIS DISABLE SWITCH',
-            7: 'Motor power is DISABLED by SOFTWARE'},
-        'indexer': {
-            0: 'Indexer source is INTERNAL',
-            1: 'Indexer source is INSYSTEM',
-            2: 'Indexer source is EXTERNAL',
-            3: 'Indexer source is LINKED'},
-        'stopcode': {
-            0: 'No abnormal stop condition',
-            1: 'Last motion stopped by a STOP command',
-            2: 'Last motion stopped by an ABORT command or condition',
-            3: 'Last motion stopped when the LIMIT+ was reached',
-            4: 'Last motion stopped when the LIMIT- was reached',
-            5: 'Last motion stopped by a configured stop condition',
-            6: 'Last motion stopped because the axis power was DISABLED',
-            7: 'Last motion stopped ERROR: movement in progress?',
-            8: 'Internal failure',
-            9: 'Motor failure',
-            10: 'Power overload',
-            11: 'Driver overheating',
-            12: 'Close loop error',
-            13: 'Control encoder error',
-            14: 'N/A',
-            15: 'External alarm'},
+        'mode': dict(enumerate(_MODE_STR)),
+        'disable': dict(enumerate(_DISABLE_STR)),
+        'indexer': dict(enumerate(_INDEXER_STR)),
+        'stopcode': dict(enumerate(_STOPCODE_STR)),
         'info': {}}
 
+    fields = StateFields._fields
+
+    __slots__ = ('_status_reg',)
+
     def __init__(self, status_register):
-        self._status_reg = status_register
+        # Store a native 32 bits int: numpy scalars coming from bulk reads
+        # would make every shift and mask go through numpy dispatch. The
+        # fields are decoded by the accessors, on demand: most users read
+        # only one or two of them.
+        object.__setattr__(self, '_status_reg',
+                           int(status_register) & 0xFFFFFFFF)
+
+    # States are read-only, so instances can be shared (see from_register)
+    def __setattr__(self, name, value):
+        raise AttributeError('State objects are read-only')
+
+    def __delattr__(self, name):
+        raise AttributeError('State objects are read-only')
+
+    def __reduce__(self):
+        return type(self), (self._status_reg,)
+
+    @staticmethod
+    def from_register(status_register):
+        """
+        Return the State of a status register. Most axes report the same few
+        registers poll after poll, so the States of recent registers are
+        cached and shared: repeated registers return the same object.
+
+        :param status_register: int
+        :return: State
+        """
+        return _cached_state(status_register)
+
+    def __repr__(self):
+        reg = self._status_reg
+        return '{0}(0x{1:08X}: mode={2} ready={3:d} moving={4:d} ' \
+               'disable={5} stopcode={6} lim+={7:d} lim-={8:d})'.format(
+                   type(self).__name__, reg, self.get_mode_str(),
+                   self.is_ready(), self.is_moving(), self.get_disable_code(),
+                   self.get_stop_code(), self.is_limit_positive(),
+                   self.is_limit_negative())
 
     @property
     def status_register(self):
         return self._status_reg
 
+    @staticmethod
+    def unpack(status_register):
+        """
+        Decode all the fields of a status register in one pass.
+
+        :param status_register: int
+        :return: StateFields
+        """
+        r = int(status_register)
+        # The single bit flags are tested in place, without shifting them
+        return StateFields(
+            (r & 0x1) != 0, (r & 0x2) != 0, (r >> 2) & 3, (r >> 4) & 7,
+            (r >> 7) & 3, (r & 0x200) != 0, (r & 0x400) != 0,
+            (r & 0x800) != 0, (r & 0x1000) != 0, (r & 0x2000) != 0,
+            (r >> 14) & 15, (r & 0x40000) != 0, (r & 0x80000) != 0,
+            (r & 0x100000) != 0, (r & 0x200000) != 0, (r & 0x400000) != 0,
+            (r & 0x800000) != 0, (r >> 24) & 255)
+
+    @classmethod
+    def from_buffer(cls, buf, n=None):
+        """
+        Create the State objects of the status registers packed in a binary
+        buffer as little endian 32 bits words.
+
+        :param buf: bytes-like object
+        :param n: int, number of registers to read. By default all the
+                  registers in the buffer.
+        :return: [State]
+        """
+        if n is None:
+            n = memoryview(buf).nbytes // 4
+        return list(map(cls, _unpack_regs(buf, n)))
+
+    @staticmethod
+    def decode_many(status_registers):
+        """
+        Decode all the fields of many status registers in one pass. Useful
+        for polling loops over many axes, where creating one State per axis
+        is too slow.
+
+        :param status_registers: [int] or numpy array
+        :return: numpy.ndarray (uint8) with one row per register and one
+                 column per field, in the order given by State.fields
+        """
+        regs = numpy.asarray(status_registers, dtype=numpy.uint32).reshape(-1)
+        decoded = numpy.empty((regs.size, len(_STATE_FIELDS)),
+                              dtype=numpy.uint8)
+        # Decode every field into the same scratch array, so the loop does
+        # not allocate temporaries
+        scratch = numpy.empty_like(regs)
+        for column, (_, shift, mask) in enumerate(_STATE_FIELDS):
+            numpy.right_shift(regs, shift, out=scratch)
+            numpy.bitwise_and(scratch, mask, out=scratch)
+            decoded[:, column] = scratch
+        return decoded
+
+    @staticmethod
+    def decode_batch(status_registers):
+        """
+        Decode many status registers at once, returning one array per field.
+        Same decoding as decode_many, arranged by field name.
+
+        :param status_registers: [int] or numpy array
+        :return: {str: numpy.ndarray} indexed by the names in State.fields.
+                 The single bit fields are boolean arrays.
+        """
+        decoded = State.decode_many(status_registers)
+        return {name: decoded[:, column].astype(bool) if mask == 1
+                else decoded[:, column]
+                for column, (name, _, mask) in enumerate(_STATE_FIELDS)}
+
     def is_present(self):
         """
         Check if the driver is present.
 
         :return: bool
         """
-        val = self._status_reg >> 0
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x1) != 0
 
     def is_alive(self):
         """
@@ -311,9 +596,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 1
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x2) != 0
 
     def get_mode_code(self):
         """
@@ -321,18 +604,15 @@ class State:
 
         :return: str
         """
-        val = self._status_reg >> 2
-        val = val & 3
-        return val
+        return (self._status_reg >> 2) & 3
 
     def get_mode_str(self):
         """
-        Return mode (str)
+        Return mode (str). The returned string is interned.
 
         :return: str
         """
-        mode = self.get_mode_code()
-        return self.status_meaning['mode'][mode]
+        return _MODE_STR[(self._status_reg >> 2) & 3]
 
     def is_disabled(self):
         """
@@ -340,9 +620,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 4
-        val = val & 7
-        return val > 0
+        return (self._status_reg & _DISABLE_MASK) != 0
 
     def get_disable_code(self):
         """
@@ -350,18 +628,15 @@ class State:
 
         :return: int
         """
-        val = self._status_reg >> 4
-        val = val & 7
-        return val
+        return (self._status_reg >> 4) & 7
 
     def get_disable_str(self):
         """
-        Get the disable string.
+        Get the disable string. The returned string is interned.
 
         :return: str
         """
-        disable_code = self.get_disable_code()
-        return self.status_meaning['disable'][disable_code]
+        return _DISABLE_STR[(self._status_reg >> 4) & 7]
 
     def get_indexer_code(self):
         """
@@ -369,18 +644,15 @@ class State:
 
         :return: int
         """
-        val = self._status_reg >> 7
-        val = val & 3
-        return val
+        return (self._status_reg >> 7) & 3
 
     def get_indexer_str(self):
         """
-        Get indexer string.
+        Get indexer string. The returned string is interned.
 
         :return: str
         """
-        index_code = self.get_indexer_code()
-        return self.status_meaning['indexer'][index_code]
+        return _INDEXER_STR[(self._status_reg >> 7) & 3]
 
     def is_ready(self):
         """
@@ -388,9 +660,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 9
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x200) != 0
 
     def is_moving(self):
         """
@@ -398,9 +668,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 10
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x400) != 0
 
     def is_settling(self):
         """
@@ -408,9 +676,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 11
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x800) != 0
 
     def is_outofwin(self):
         """
@@ -418,9 +684,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 12
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x1000) != 0
 
     def is_warning(self):
         """
@@ -428,9 +692,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 13
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x2000) != 0
 
     def get_stop_code(self):
         """
@@ -438,18 +700,15 @@ class State:
 
         :return: int
         """
-        val = self._status_reg >> 14
-        val = val & 15
-        return val
+        return (self._status_reg >> 14) & 15
 
     def get_stop_str(self):
         """
-        Get the stop code string.
+        Get the stop code string. The returned string is interned.
 
         :return: str
         """
-        stop_code = self.get_stop_code()
-        return self.status_meaning['stopcode'][stop_code]
+        return _STOPCODE_STR[(self._status_reg >> 14) & 15]
 
     def is_limit_positive(self):
         """
@@ -457,9 +716,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 18
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x40000) != 0
 
     def is_limit_negative(self):
         """
@@ -467,9 +724,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 19
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x80000) != 0
 
     def is_inhome(self):
         """
@@ -477,9 +732,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 20
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x100000) != 0
 
     def is_5vpower(self):
         """
@@ -487,9 +740,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 21
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x200000) != 0
 
     def is_verserr(self):
         """
@@ -497,9 +748,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 22
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x400000) != 0
 
     # TODO check why the documentation is not updated
     def is_poweron(self):
@@ -508,9 +757,7 @@ class State:
 
         :return: bool
         """
-        val = self._status_reg >> 23
-        val = val & 1
-        return bool(val)
+        return (self._status_reg & 0x800000) != 0
 
     def get_info_code(self):
         """
@@ -518,27 +765,52 @@ class State:
 
         :return: str
         """
-        val = self._status_reg >> 24
-        val = val & 255
-        return val
+        return self._status_reg >> 24
+
+
+_cached_state = functools.lru_cache(maxsize=4096)(State)
+
+
+_state_register = operator.attrgetter('_status_reg')
 
 
 def is_moving(states):
-    return any(state.is_moving() for state in states)
+    if isinstance(states, numpy.ndarray):
+        return is_moving_batch(states)
+    # OR all the registers together and test the moving bit once
+    regs = functools.reduce(operator.or_, map(_state_register, states), 0)
+    return bool(regs & _MOVING_MASK)
+
+
+def is_moving_batch(status_registers):
+    """
+    Check if any of the status registers has the moving bit set.
+
+    :param status_registers: [int] or numpy array
+    :return: bool
+    """
+    regs = numpy.asarray(status_registers, dtype=numpy.uint32)
+    return bool(numpy.bitwise_or.reduce(regs, axis=None) & _MOVING_MASK)
 
 
 def calc_deltas(p1, p2):
+    if isinstance(p1, numpy.ndarray) or isinstance(p2, numpy.ndarray):
+        return numpy.abs(numpy.subtract(p1, p2))
+    # Faster than numpy for the few axes of a group
     return [abs(a - b) for a, b in zip(p1, p2)]
 
 
 def gen_rate_limiter(generator, period=0.1):
-    last_update = 0
+    deadline = time.monotonic()
     for event in generator:
-        nap = period - (time.monotonic() - last_update)
-        if nap > 0:
-            time.sleep(nap)
+        now = time.monotonic()
+        if now < deadline:
+            time.sleep(deadline - now)
+        else:
+            # Behind schedule: restart it instead of bursting to catch up
+            deadline = now
+        deadline += period
         yield event
-        last_update = time.monotonic()
 
 
 def interrupt_myself():
@@ -561,10 +833,11 @@ def get_ctrl_item(f, axes, default=None):
 
 
 def get_item(motors, name, default=None):
+    getter = operator.attrgetter(name)
     values = []
     for motor in motors:
         try:
-            value = getattr(motor, name)
+            value = getter(motor)
         except RuntimeError:
             value = default
         values.append(value)
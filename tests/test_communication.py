@@ -0,0 +1,71 @@
+import array
+import struct
+import threading
+
+import pytest
+
+from icepap.communication import IcePAPCommunication
+
+
+class FakeSocket:
+
+    def __init__(self, lock=None):
+        self.lock = lock
+        self.written = []
+        self.locked = []
+
+    def write(self, data):
+        self.written.append(data)
+        if self.lock is not None:
+            # Check from another thread that the lock is held
+            thread = threading.Thread(target=self._try_lock)
+            thread.start()
+            thread.join()
+
+    def _try_lock(self):
+        acquired = self.lock.acquire(False)
+        if acquired:
+            self.lock.release()
+        self.locked.append(not acquired)
+
+
+def make_comm():
+    comm = IcePAPCommunication.__new__(IcePAPCommunication)
+    comm._lock = threading.RLock()
+    comm._sock = FakeSocket(comm._lock)
+    comm.multiline_answer = False
+    return comm
+
+
+def test_send_binary_cmd_holds_lock():
+    comm = make_comm()
+    comm.send_binary_cmd('1:*ECAMDAT AXIS FLOAT', [1, 2, 3])
+    assert len(comm._sock.written) == 2
+    assert comm._sock.written[0] == b'1:*ECAMDAT AXIS FLOAT\r'
+    assert comm._sock.written[1].endswith(b'\x01\x00\x02\x00\x03\x00\r')
+    assert comm._sock.locked == [True, True]
+
+
+def test_send_binary_rejects_non_integers():
+    comm = make_comm()
+    with pytest.raises(ValueError):
+        comm.send_binary([1.5])
+    with pytest.raises(ValueError):
+        comm.send_binary([0x10000])
+    assert comm._sock.written == []
+
+
+def test_send_binary_format():
+    comm = make_comm()
+    # Large enough for the 32-bit checksum to wrap around
+    data = [0xffff, 1, 0x1234] * 70000
+    comm.send_binary(data)
+    # Same bytes as the former struct/array based implementation
+    expected = struct.pack('<III', 0xa5aa555a, len(data),
+                           sum(data) & 0xffffffff)
+    expected += array.array('H', data).tobytes() + b'\r'
+    assert comm._sock.written == [expected]
+    # Buffers give the same block
+    comm._sock.written = []
+    comm.send_binary(memoryview(array.array('H', data)))
+    assert comm._sock.written == [expected]
@@ -1,7 +1,11 @@
 import pytest
 import random
+import struct
 
-from icepap import IcePAPController
+import numpy
+
+from icepap import FirmwareVersion, IcePAPController
+from icepap.axis import IcePAPAxis
 
 from patch_socket import mock_socket
 
@@ -355,3 +359,41 @@ def test_expert_update_axes(expert_pap):
     assert 1 in expert_pap
     assert 5 not in expert_pap
     assert m1 is expert_pap[1]
+
+
+@pytest.mark.parametrize('dtype, data, fmt', [
+    ('DWORD', [1, -2, 70000], '<3i'),
+    ('FLOAT', [1.5, -2.25], '<2f'),
+    ('DFLOAT', [1.5, -2.25], '<2d'),
+    ('BYTE', [1, -2, 3, 127], '<4b')])
+def test_get_ushort_list(dtype, data, fmt):
+    lushorts = IcePAPAxis.get_ushort_list(data, dtype)
+    assert isinstance(lushorts, numpy.ndarray)
+    assert lushorts.dtype == numpy.uint16
+    # Same words as packing the values with struct
+    packed = struct.pack(fmt, *data)
+    expected = struct.unpack('<{0}H'.format(len(packed) // 2), packed)
+    assert tuple(lushorts.tolist()) == expected
+    array_data = numpy.array(data)
+    assert IcePAPAxis.get_ushort_list(array_data, dtype).tolist() == \
+        list(expected)
+
+
+@pytest.mark.parametrize('dtype, data', [
+    ('DWORD', [1.7, 2.2]),
+    ('DWORD', numpy.array([1.5, 2.0])),
+    ('DWORD', [2 ** 31]),
+    ('BYTE', [1.5, 2.0]),
+    ('BYTE', [128, 0]),
+    ('WORD', [1, 2])])
+def test_get_ushort_list_invalid(dtype, data):
+    with pytest.raises(ValueError):
+        IcePAPAxis.get_ushort_list(data, dtype)
+
+
+def test_firmware_version_blank_lines():
+    ver = FirmwareVersion(['SYSTEM : 3.17', '   CONTROLLER: 3.17', '',
+                           '      DSP : 3.67'])
+    assert ver['SYSTEM']['VER'] == (3.17, '')
+    assert ver['SYSTEM']['CONTROLLER']['DSP'] == (3.67, '')
+    assert '' not in ver
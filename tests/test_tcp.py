@@ -0,0 +1,74 @@
+import socket
+import threading
+import time
+
+from icepap import tcp
+
+
+class RejectingSocket(socket.socket):
+
+    def setsockopt(self, level, option, value):
+        if level == socket.IPPROTO_TCP and option != socket.TCP_NODELAY:
+            raise OSError('option not supported')
+        return super().setsockopt(level, option, value)
+
+
+def test_create_connection_keepalive_best_effort(monkeypatch):
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    monkeypatch.setattr(tcp.socket, 'socket', RejectingSocket)
+    sock = tcp.create_connection(*server.getsockname())
+    try:
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+    finally:
+        sock.close()
+        server.close()
+
+
+def open_pair():
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    raw = tcp.RawTCP(*server.getsockname(), timeout=2)
+    peer, _ = server.accept()
+    server.close()
+    raw.wait_open()
+    return raw, peer
+
+
+def test_readline_eol_split_across_blocks():
+    raw, peer = open_pair()
+    try:
+        peer.sendall(b'1:?POS 10\r')
+        # Let the first block arrive alone, the eol continues in the next
+        time.sleep(0.05)
+        peer.sendall(b'\n1:?POS 20\r\nsurplus')
+        assert raw.readline(eol=b'\r\n') == b'1:?POS 10\r\n'
+        # The surplus is kept for the next reads
+        assert raw.readline(eol=b'\r\n') == b'1:?POS 20\r\n'
+        assert raw._buffer == b'surplus'
+        assert raw.read(100) == b'surplus'
+    finally:
+        raw.close()
+        peer.close()
+
+
+def test_write_larger_than_block_size():
+    raw, peer = open_pair()
+    data = bytes(range(256)) * (3 * tcp.BLOCK_SIZE // 256) + b'end'
+    received = bytearray()
+
+    def receive():
+        while len(received) < len(data):
+            received.extend(peer.recv(65536))
+
+    thread = threading.Thread(target=receive)
+    thread.start()
+    try:
+        raw.write(data)
+        thread.join(2)
+        assert bytes(received) == data
+    finally:
+        raw.close()
+        peer.close()
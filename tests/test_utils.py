@@ -0,0 +1,162 @@
+import os
+import pickle
+import subprocess
+import sys
+import textwrap
+import warnings
+
+import numpy
+import pytest
+
+from icepap.utils import State, Info, InfoSource, Registers, RegisterId, \
+    deprecated, is_moving, calc_deltas
+
+
+def test_state_decode_many():
+    regs = [0x00205013, 0, 0xff000400]
+    decoded = State.decode_many(regs)
+    assert decoded.shape == (len(regs), len(State.fields))
+    for row, reg in zip(decoded, regs):
+        state = State(reg)
+        fields = dict(zip(State.fields, row.tolist()))
+        assert fields['present'] == state.is_present()
+        assert fields['mode'] == state.get_mode_code()
+        assert fields['disable'] == state.get_disable_code()
+        assert fields['moving'] == state.is_moving()
+        assert fields['stopcode'] == state.get_stop_code()
+        assert fields['v5power'] == state.is_5vpower()
+        assert fields['info'] == state.get_info_code()
+
+
+def test_state_decode_batch():
+    regs = numpy.array([0x00205013, 0, 0xff000400], dtype=numpy.uint32)
+    decoded = State.decode_batch(regs)
+    assert set(decoded) == set(State.fields)
+    assert decoded['moving'].tolist() == [False, False, True]
+    assert decoded['stopcode'].tolist() == [1, 0, 0]
+    assert decoded['info'].tolist() == [0, 0, 0xff]
+    assert is_moving(regs)
+    assert not is_moving(regs[:2])
+    assert is_moving([State(reg) for reg in regs])
+
+
+def test_state_unpack():
+    fields = State.unpack(0x00205013)
+    assert fields._fields == State.fields
+    assert fields.present is True
+    assert fields.disable == 1
+    assert fields.stopcode == 1
+    assert fields.v5power is True
+    assert fields.moving is False
+    assert State(0x00205013).is_disabled() is True
+
+
+def test_state_from_buffer():
+    regs = [0x00205013, 0, 0xff000400]
+    buf = b''.join(reg.to_bytes(4, 'little') for reg in regs)
+    states = State.from_buffer(bytearray(buf))
+    assert [s.status_register for s in states] == regs
+    states = State.from_buffer(buf, 2)
+    assert [s.status_register for s in states] == regs[:2]
+
+
+def test_state_from_register_shared():
+    state = State.from_register(0x00205013)
+    assert State.from_register(0x00205013) is state
+    assert State.from_register(0x400) is not state
+    # Shared instances can not be modified
+    with pytest.raises(AttributeError):
+        state._status_reg = 0
+    with pytest.raises(AttributeError):
+        state.status_register = 0
+    with pytest.raises(AttributeError):
+        del state._status_reg
+    assert state.status_register == 0x00205013
+    copy = pickle.loads(pickle.dumps(state))
+    assert copy.status_register == state.status_register
+
+
+def test_state_repr():
+    assert repr(State(0x00205013)) == \
+        'State(0x00205013: mode=OPER ready=0 moving=0 disable=1 ' \
+        'stopcode=1 lim+=0 lim-=0)'
+
+
+def test_state_strings():
+    state = State(0x00205013)
+    assert state.get_mode_str() is State(0).get_mode_str()
+    assert state.get_disable_str() == State.status_meaning['disable'][1]
+    assert state.get_stop_str() == State.status_meaning['stopcode'][1]
+    assert state.get_indexer_str() == State.status_meaning['indexer'][0]
+
+
+def test_state_register_is_int():
+    reg = numpy.uint32(0x00205013)
+    state = State(reg)
+    assert type(state.status_register) is int
+    assert state.status_register == 0x00205013
+    assert State(-1).status_register == 0xFFFFFFFF
+
+
+def test_deprecated_warns_once():
+    @deprecated('new_api')
+    def old_api(value):
+        return value
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        assert old_api(1) == 1
+        assert old_api(2) == 2
+    assert len(caught) == 1
+    assert caught[0].category is FutureWarning
+    assert caught[0].filename == __file__
+
+
+def test_deprecated_shown_with_default_filters():
+    # pytest changes the warning filters, use a fresh interpreter
+    code = textwrap.dedent("""
+        import warnings
+        from icepap.utils import deprecated
+
+        @deprecated('new_api')
+        def old_api():
+            pass
+
+        old_api()
+        old_api()
+        """)
+    env = dict(os.environ)
+    env.pop('PYTHONWARNINGS', None)
+    result = subprocess.run([sys.executable, '-c', code], env=env,
+                            stderr=subprocess.PIPE, universal_newlines=True)
+    assert result.returncode == 0
+    assert result.stderr.count('FutureWarning') == 1
+
+
+def test_deprecated_follows_caller_filters():
+    @deprecated('new_api')
+    def old_api():
+        pass
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FutureWarning)
+        with pytest.raises(FutureWarning):
+            old_api()
+
+
+def test_info_source_and_register_enums():
+    for wire in Info.Sources:
+        assert InfoSource.from_wire(wire).wire == wire
+    assert InfoSource.from_wire('lim+') == InfoSource.LIMP
+    for wire in Registers.EcamSourceRegisters:
+        assert RegisterId.from_wire(wire).wire == wire
+
+
+def test_calc_deltas():
+    assert calc_deltas([1, -5, 10], [3, 5, 10]) == [2, 10, 0]
+    # Sequences of different length and iterators as before
+    assert calc_deltas([1, 2, 3], [0, 0]) == [1, 2]
+    assert calc_deltas(iter([1, 2]), (x for x in [2, 4])) == [1, 2]
+    deltas = calc_deltas(numpy.array([1.5, -2]), [0.5, 2])
+    assert isinstance(deltas, numpy.ndarray)
+    assert deltas.tolist() == [1.0, 4.0]